@@ -1,22 +1,44 @@
 #!/usr/bin/env python3
-import torch
 import time
 import argparse
+import atexit
+import concurrent.futures
+import fcntl
+import json
 import logging
-import random
+import logging.handlers
+import mmap
 import os
 import signal
 import sys
 import subprocess
+import threading
 from pathlib import Path
 import yaml
 
+# libyaml 的 C loader 比纯 Python loader 快得多，可用时优先使用
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# 优先使用 NVML 库直接查询 GPU 内存（进程内调用，无需 fork nvidia-smi）
+try:
+    import pynvml
+    pynvml.nvmlInit()
+    atexit.register(pynvml.nvmlShutdown)
+    NVML_AVAILABLE = True
+except Exception:
+    pynvml = None
+    NVML_AVAILABLE = False
+
 # 配置文件和 PID 文件路径
 SCRIPT_DIR = Path(__file__).parent
 CONFIG_DIR = Path.home() / ".config" / "gpu_occupy"
 PID_FILE = CONFIG_DIR / "occupy.pid"
 LOG_FILE = CONFIG_DIR / "occupy.log"
 CONFIG_YAML = SCRIPT_DIR / "config.yaml"
+CONFIG_CACHE = CONFIG_DIR / "config.json"
 
 def setup_config_dir():
     """创建配置目录"""
@@ -39,20 +61,68 @@ def load_config_defaults():
     
     try:
         if CONFIG_YAML.exists():
+            mtime = CONFIG_YAML.stat().st_mtime
+
+            # 优先读取 JSON 缓存（json.load 比 yaml.safe_load 快一个数量级）
+            cached_config = _load_config_cache(mtime)
+            if cached_config is not None:
+                default_config.update(cached_config)
+                logging.debug(f"Loaded configuration from cache {CONFIG_CACHE}")
+                return default_config
+
             with open(CONFIG_YAML, 'r', encoding='utf-8') as f:
-                yaml_config = yaml.safe_load(f)
+                yaml_config = yaml.load(f, Loader=_YamlLoader)
                 if yaml_config:
                     default_config.update(yaml_config)
                     logging.debug(f"Loaded configuration from {CONFIG_YAML}")
+                    _save_config_cache(yaml_config, mtime)
     except Exception as e:
         logging.warning(f"Failed to load config from {CONFIG_YAML}: {e}, using built-in defaults")
-    
+
     return default_config
 
+def _load_config_cache(mtime):
+    """读取 JSON 配置缓存，mtime 不匹配时返回 None"""
+    try:
+        with open(CONFIG_CACHE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.pop('__mtime__', None) == mtime:
+            return cached
+    except (FileNotFoundError, ValueError, OSError):
+        pass
+    return None
+
+def _save_config_cache(yaml_config, mtime):
+    """原子写入 JSON 配置缓存（tmp + rename）"""
+    try:
+        setup_config_dir()
+        tmp_path = CONFIG_CACHE.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({**yaml_config, '__mtime__': mtime}, f)
+        os.replace(tmp_path, CONFIG_CACHE)
+    except OSError:
+        pass  # 缓存写入失败不影响正常流程
+
+# 持有锁文件的排他锁，fd 需存活至进程退出
+PID_LOCK_FILE = CONFIG_DIR / "occupy.lock"
+_pid_lock_file = None
+
 def save_pid():
-    """保存当前进程 PID"""
-    with open(PID_FILE, 'w') as f:
+    """原子写入当前进程 PID（tmp + rename），写入前先持锁防止双重启动"""
+    global _pid_lock_file
+    setup_config_dir()
+    # 先在固定的锁文件上取排他锁，双重启动会在这里立即失败
+    try:
+        _pid_lock_file = open(PID_LOCK_FILE, 'a')
+        fcntl.flock(_pid_lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        print(f"⚠️  Occupy is already running (lock held on {PID_LOCK_FILE})")
+        sys.exit(1)
+
+    tmp_path = PID_FILE.with_suffix('.pid.tmp')
+    with open(tmp_path, 'w') as f:
         f.write(str(os.getpid()))
+    os.replace(tmp_path, PID_FILE)
 
 def get_pid():
     """获取已保存的 PID"""
@@ -78,14 +148,9 @@ def kill_occupy_process():
         process_phase = "unknown"
         if LOG_FILE.exists():
             try:
-                with open(LOG_FILE, 'r') as f:
-                    lines = f.readlines()
-                    if lines:
-                        recent_lines = [line.lower() for line in lines[-10:]]
-                        if any('memory occupation started' in line for line in recent_lines):
-                            process_phase = "occupation"
-                        elif any('ready for' in line or 'wait timer' in line or 'need' in line and 'more minutes' in line for line in recent_lines):
-                            process_phase = "waiting"
+                phase = detect_log_phase(tail_log_lines(LOG_FILE))
+                if phase in ("occupation", "waiting"):
+                    process_phase = phase
             except Exception:
                 pass
 
@@ -110,26 +175,101 @@ def kill_occupy_process():
         print("ℹ️  No occupy process is currently running")
         return False
 
+class JsonLogFormatter(logging.Formatter):
+    """JSONL 日志格式，phase 字段显式标记阶段转换，供状态解析使用"""
+
+    def format(self, record):
+        return json.dumps({
+            'ts': self.formatTime(record),
+            'level': record.levelname,
+            'phase': getattr(record, 'phase', None),
+            'msg': record.getMessage(),
+        }, ensure_ascii=False)
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """带轮转的日志 handler，普通记录留在写缓冲中，阶段转换和 WARNING 以上立即落盘"""
+
+    def emit(self, record):
+        self._flush_needed = (record.levelno >= logging.WARNING
+                              or getattr(record, 'phase', None) is not None)
+        super().emit(record)
+
+    def flush(self):
+        if getattr(self, '_flush_needed', True):
+            super().flush()
+
+def detect_log_phase(lines):
+    """反向扫描日志行，返回最近一条带 phase 字段的记录的 phase 值（'waiting'/'occupation'/'stopped'）"""
+    for line in reversed(lines):
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        phase = record.get('phase') if isinstance(record, dict) else None
+        if phase:
+            return phase
+    return None
+
+def tail_log_lines(path, n=10):
+    """读取文件末尾最多 n 行，mmap 反向扫描换行符，只解码需要的尾部字节"""
+    if os.stat(path).st_size == 0:
+        return []
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = len(mm)
+            # 从末尾反向查找第 n 个换行符，忽略文件结尾的换行
+            start = end - 1 if mm[end - 1:end] == b'\n' else end
+            for _ in range(n):
+                pos = mm.rfind(b'\n', 0, start)
+                if pos < 0:
+                    start = 0
+                    break
+                start = pos
+            data = mm[start:end].decode('utf-8', 'replace')
+    return data.splitlines()[-n:]
+
 def cleanup_pid_file():
     """清理 PID 文件"""
     if PID_FILE.exists():
         PID_FILE.unlink()
 
-def get_gpu_memory_info(gpu_index):
-    """获取指定 GPU 的内存信息"""
+_nvml_handles = {}
+
+def _get_gpu_memory_infos_nvml(gpu_indexes):
+    """通过 NVML 批量获取 GPU 内存信息（进程内调用，亚毫秒级）"""
+    memory_infos = {}
+    for gpu_index in gpu_indexes:
+        try:
+            handle = _nvml_handles.get(gpu_index)
+            if handle is None:
+                handle = pynvml.nvmlDeviceGetHandleByIndex(gpu_index)
+                _nvml_handles[gpu_index] = handle
+            info = pynvml.nvmlDeviceGetMemoryInfo(handle)
+            memory_infos[gpu_index] = (info.used / 2**30, info.total / 2**30)
+        except pynvml.NVMLError:
+            continue
+    return memory_infos
+
+def get_gpu_memory_infos(gpu_indexes):
+    """批量获取指定 GPU 的内存信息，优先 NVML，失败时回退到 nvidia-smi"""
+    if NVML_AVAILABLE:
+        return _get_gpu_memory_infos_nvml(gpu_indexes)
+
+    id_list = ','.join(str(idx) for idx in gpu_indexes)
     try:
         result = subprocess.run(
-            ['nvidia-smi', '--query-gpu=memory.used,memory.total', '--format=csv,noheader,nounits', f'--id={gpu_index}'],
+            ['nvidia-smi', '--query-gpu=index,memory.used,memory.total', '--format=csv,noheader,nounits', f'--id={id_list}'],
             capture_output=True, text=True, check=True
         )
-        memory_info = result.stdout.strip().split(', ')
-        used_memory_mb = int(memory_info[0])
-        total_memory_mb = int(memory_info[1])
-        used_memory_gb = used_memory_mb / 1024
-        total_memory_gb = total_memory_mb / 1024
-        return used_memory_gb, total_memory_gb
+        memory_infos = {}
+        for line in result.stdout.splitlines():
+            if not line.strip():
+                continue
+            gpu_index, used_memory_mb, total_memory_mb = line.split(', ')
+            memory_infos[int(gpu_index)] = (int(used_memory_mb) / 1024, int(total_memory_mb) / 1024)
+        return memory_infos
     except (subprocess.CalledProcessError, ValueError, IndexError):
-        return None, None
+        return {}
 
 def check_gpu_ready_for_occupation(gpu_indexes, mem_threshold):
     """检查所有指定 GPU 是否准备好被占用（所有GPU的已使用内存都小于阈值）"""
@@ -137,29 +277,37 @@ def check_gpu_ready_for_occupation(gpu_indexes, mem_threshold):
         logging.info("Threshold <= 0, immediately ready for occupation")
         return True  # 如果阈值为 0 或负数，立即准备占用
 
-    logging.info(f"Checking GPU readiness with used memory threshold {mem_threshold}GB")
+    logging.debug("Checking GPU readiness with used memory threshold %sGB", mem_threshold)
+    memory_infos = get_gpu_memory_infos(gpu_indexes)
     for gpu_index in gpu_indexes:
-        used_memory_gb, total_memory_gb = get_gpu_memory_info(gpu_index)
+        used_memory_gb, total_memory_gb = memory_infos.get(gpu_index, (None, None))
         if used_memory_gb is None:
-            logging.warning(f"Could not get memory info for GPU {gpu_index}, assuming ready for occupation")
+            logging.warning("Could not get memory info for GPU %s, assuming ready for occupation", gpu_index)
             continue
 
-        logging.info(f"GPU {gpu_index}: {used_memory_gb:.2f}GB used (threshold: {mem_threshold}GB)")
+        logging.debug("GPU %s: %.2fGB used (threshold: %sGB)", gpu_index, used_memory_gb, mem_threshold)
         if used_memory_gb >= mem_threshold:
-            logging.info(f"GPU {gpu_index}: {used_memory_gb:.2f}GB used >= {mem_threshold}GB threshold (not ready)")
+            logging.info("GPU %s: %.2fGB used >= %sGB threshold (not ready)", gpu_index, used_memory_gb, mem_threshold)
             return False
 
-    logging.info("All GPUs have low usage, ready for occupation")
+    logging.debug("All GPUs have low usage, ready for occupation")
     return True
 
+# 终止信号通过 Event 唤醒正在休眠的主循环，实现即时且干净的退出
+_stop_event = threading.Event()
+
 def signal_handler(signum, frame):
     """信号处理器，用于优雅退出"""
     logging.info("Received termination signal, cleaning up...")
     cleanup_pid_file()
-    sys.exit(0)
+    _stop_event.set()
 
 def occupy_gpu_memory(gpu_indexes, memory_size, sleep_min, compute_min, compute=False, wait_minutes=0, mem_threshold=0, refresh_minutes=1):
     """GPU 内存和计算占用函数"""
+    # 延迟导入重依赖：off/status 子命令不需要 torch/numpy，避免约 1 秒的导入开销
+    import torch
+    import numpy as np
+
     # 保存 PID（提前保存，以便在等待阶段也能被 stop 命令终止）
     save_pid()
 
@@ -171,12 +319,12 @@ def occupy_gpu_memory(gpu_indexes, memory_size, sleep_min, compute_min, compute=
         logging.root.removeHandler(handler)
     
     # 设置新的日志配置（只写入文件，避免后台进程的输出问题）
+    # 使用 'w' 模式覆盖之前的日志，轮转限制日志体积
+    file_handler = BufferedRotatingFileHandler(LOG_FILE, mode='w', maxBytes=1_000_000, backupCount=3)
+    file_handler.setFormatter(JsonLogFormatter())
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(LOG_FILE, mode='w')  # 使用 'w' 模式覆盖之前的日志
-        ],
+        handlers=[file_handler],
         force=True  # 强制重新配置
     )
 
@@ -203,78 +351,149 @@ def occupy_gpu_memory(gpu_indexes, memory_size, sleep_min, compute_min, compute=
 
     # 检查 GPU 准备状态并等待
     if mem_threshold > 0 and wait_minutes > 0:
-        logging.info(f"Starting wait logic: threshold={mem_threshold}GB, wait_time={wait_minutes}min")
+        logging.info(f"Starting wait logic: threshold={mem_threshold}GB, wait_time={wait_minutes}min",
+                     extra={'phase': 'waiting'})
         ready_start_time = None
         while True:
             is_ready = check_gpu_ready_for_occupation(gpu_indexes, mem_threshold)
-            logging.info(f"GPU ready check result: {is_ready}")
+            logging.debug("GPU ready check result: %s", is_ready)
             
             if is_ready:
                 if ready_start_time is None:
                     ready_start_time = time.time()
-                    logging.info("All GPU(s) have low memory, starting wait timer...")
+                    logging.info("All GPU(s) have low memory, starting wait timer...",
+                                 extra={'phase': 'waiting'})
 
                 wait_duration = (time.time() - ready_start_time) / 60  # 转换为分钟
                 if wait_duration >= wait_minutes:
-                    logging.info(f"GPU(s) have been ready for {wait_duration:.1f} minutes, starting occupation...")
+                    logging.info("GPU(s) have been ready for %.1f minutes, starting occupation...", wait_duration)
                     break
                 else:
                     remaining = wait_minutes - wait_duration
-                    logging.info(f"GPU(s) ready for {wait_duration:.1f}/{wait_minutes} minutes, need {remaining:.1f} more minutes...")
+                    logging.info("GPU(s) ready for %.1f/%s minutes, need %.1f more minutes...", wait_duration, wait_minutes, remaining,
+                                 extra={'phase': 'waiting'})
             else:
                 if ready_start_time is not None:
-                    logging.info("GPU(s) no longer ready (some have high usage), resetting timer...")
+                    logging.info("GPU(s) no longer ready (some have high usage), resetting timer...",
+                                 extra={'phase': 'waiting'})
                 else:
-                    logging.info("GPU(s) not ready (high usage detected), waiting...")
+                    logging.info("GPU(s) not ready (high usage detected), waiting...",
+                                 extra={'phase': 'waiting'})
                 ready_start_time = None
 
-            logging.info(f"Sleeping for {refresh_minutes} minutes before next check...")
-            time.sleep(refresh_minutes * 60)
+            logging.debug("Sleeping for %s minutes before next check...", refresh_minutes)
+            if _stop_event.wait(refresh_minutes * 60):
+                sys.exit(0)
     else:
         logging.info(f"Skipping wait logic: threshold={mem_threshold}, wait_time={wait_minutes}")
 
     # 创建 GPU 设备列表
     devices = [torch.device(f"cuda:{idx}") for idx in gpu_indexes]
 
-    # 在每个 GPU 设备上创建张量来占用指定的内存大小
+    # 在每个 GPU 设备上占用指定的内存大小
+    # 计算模式需要真实的 float32 张量供融合 kernel 使用；
+    # 纯内存占用直接向缓存分配器申请原始指针，省去 Python 张量对象的开销
+    nbytes = int(memory_size * 1024 * 1024 * 1024)
     tensors = []
+    reserved_ptrs = []  # (device_index, ptr) 列表，退出时归还
+
+    def allocate_on_device(device):
+        # 线程内绑定各自设备，使多卡的分配与清零并行进行
+        with torch.cuda.device(device):
+            if compute:
+                return torch.zeros(nbytes // 4, dtype=torch.float32, device=device)
+            free_before, _ = torch.cuda.mem_get_info(device.index)
+            ptr = torch.cuda.caching_allocator_alloc(nbytes, device=device.index)
+            free_after, total_bytes = torch.cuda.mem_get_info(device.index)
+            logging.info("GPU %s: reserved %.2f GB, %.2f/%.2f GB free", device.index,
+                         (free_before - free_after) / 2**30, free_after / 2**30, total_bytes / 2**30)
+            return (device.index, ptr)
+
     try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(devices)) as executor:
+            results = list(executor.map(allocate_on_device, devices))
+        if compute:
+            tensors = results
+        else:
+            reserved_ptrs = results
         for device in devices:
-            tensor = torch.zeros(int(memory_size * 1024 * 1024 * 1024 / 4), dtype=torch.float32, device=device)
-            tensors.append(tensor)
-            logging.info(f"Occupying {memory_size} GB of GPU {device.index} memory")
-        logging.info("GPU memory occupation started. Use `occupy off` to stop.")
+            logging.info("Occupying %s GB of GPU %s memory", memory_size, device.index)
+        logging.info("GPU memory occupation started. Use `occupy off` to stop.",
+                     extra={'phase': 'occupation'})
 
         if compute:
             logging.info("Occupying GPU utilization...")
+            # 每个设备预创建标量、独立 stream 和完成事件
+            compute_scalars = [torch.full((), 2.0, device=device) for device in devices]
+            compute_streams = [torch.cuda.Stream(device=device) for device in devices]
+            done_events = [torch.cuda.Event() for _ in devices]
+
+            # 把一批融合迭代捕获为 CUDA graph，回放时整批只需一次启动
+            graph_batch_iters = 64
+            compute_graphs = []
+            for i, device in enumerate(devices):
+                stream = compute_streams[i]
+                stream.wait_stream(torch.cuda.current_stream(device))
+                # 捕获前预热一次，确保 kernel 与分配器状态就绪
+                with torch.cuda.stream(stream):
+                    tensors[i].addcmul_(tensors[i], compute_scalars[i], value=1.0)
+                stream.synchronize()
+                graph = torch.cuda.CUDAGraph()
+                with torch.cuda.graph(graph, stream=stream):
+                    for _ in range(graph_batch_iters):
+                        tensors[i].addcmul_(tensors[i], compute_scalars[i], value=1.0)
+                compute_graphs.append(graph)
+
+            # 预生成波动因子查找表，热循环内只做数组索引，不再逐轮调用 random.uniform
+            fluctuation_factors = np.random.default_rng().uniform(0.5, 28.0 / len(gpu_indexes), 4096)
+            fluctuation_index = 0
+            # 休眠系数为循环不变量，提前算好
+            sleep_scale = 0.01 * len(tensors)
 
         while True:
             if compute:
-                logging.info(f"Starting compute cycle for {compute_min} minutes...")
+                logging.info("Starting compute cycle for %s minutes...", compute_min,
+                             extra={'phase': 'occupation'})
                 start_time = time.time()
                 end_time = start_time + compute_min * 60  # 转换计算持续时间为秒
 
                 while time.time() < end_time:
-                    for tensor in tensors:
-                        # 引入计算强度的随机波动
-                        std = 28/len(gpu_indexes)
-                        fluctuation_factor = random.uniform(0.5, std)  # 在基础强度的50%到150%之间波动
-                        tensor.mul_(2).add_(1)
-                        time.sleep(0.01 * fluctuation_factor)
+                    # 引入计算强度的随机波动（查表循环取值）
+                    fluctuation_factor = fluctuation_factors[fluctuation_index & 4095]
+                    fluctuation_index += 1
+
+                    # 在各设备独立的 stream 上并发回放整批迭代（单次启动替代逐 kernel 提交）
+                    for i, graph in enumerate(compute_graphs):
+                        with torch.cuda.stream(compute_streams[i]):
+                            graph.replay()
+                            done_events[i].record()
+                    # 等待全部设备完成后再统一休眠，避免向设备堆积未完成的 kernel
+                    for event in done_events:
+                        event.synchronize()
+                    # 乘以设备数以保持与原先逐 GPU 休眠相同的整体节奏
+                    if _stop_event.wait(sleep_scale * fluctuation_factor):
+                        sys.exit(0)
 
                 logging.info("Completed a compute cycle.")
 
             # 休眠直到下一个计算周期
-            logging.info(f"Entering rest period for {sleep_min} minutes before the next compute cycle.")
-            time.sleep(sleep_min * 60)
+            logging.info("Entering rest period for %s minutes before the next compute cycle.", sleep_min,
+                         extra={'phase': 'occupation'})
+            if _stop_event.wait(sleep_min * 60):
+                sys.exit(0)
 
     except KeyboardInterrupt:
         logging.info("Received interrupt signal, cleaning up...")
     except Exception as e:
         logging.error(f"Error occurred: {e}")
     finally:
+        for device_index, ptr in reserved_ptrs:
+            try:
+                torch.cuda.caching_allocator_delete(ptr)
+            except Exception:
+                pass
         cleanup_pid_file()
-        logging.info("GPU occupation stopped.")
+        logging.info("GPU occupation stopped.", extra={'phase': 'stopped'})
 
 def start_occupy(args):
     """启动 GPU 占用"""
@@ -331,28 +550,27 @@ def status_occupy():
         # 显示最后几行日志
         if LOG_FILE.exists():
             try:
-                with open(LOG_FILE, 'r') as f:
-                    lines = f.readlines()
-                    if lines:
-                        print("\nLast 10 log entries:")
-                        for line in lines[-10:]:
+                lines = tail_log_lines(LOG_FILE)
+                if lines:
+                    print("\nLast 10 log entries:")
+                    for line in lines:
+                        try:
+                            record = json.loads(line)
+                            print(f"  {record['ts']} - {record['level']} - {record['msg']}")
+                        except (ValueError, KeyError):
                             print(f"  {line.strip()}")
 
-                        # 检查是否在等待阶段 - 更精确的检测
-                        recent_lines = [line for line in lines[-3:]]  # 检查最近3行
-                        last_line = lines[-1].lower() if lines else ""
-
-                        # 如果最后一行包含等待相关的关键词，且没有"occupation started"或"stopped"
-                        if ('ready for' in last_line or 'need' in last_line and 'more minutes' in last_line) and \
-                           not any('occupation started' in line.lower() or 'stopped' in line.lower() for line in recent_lines[-3:]):
-                            print("\n⏳ [Status: Currently in waiting phase - monitoring GPU usage]")
-                            print("💡 Use 'occupy off' to cancel waiting and exit")
-                        elif any('occupation started' in line.lower() for line in recent_lines):
-                            print("\n🔥 [Status: Currently occupying GPU memory and compute]")
-                            print("💡 Use 'occupy off' to stop occupation and exit")
-                    else:
-                        print("\n📝 Log file exists but is empty")
-                        print("💡 Process may be initializing or encountered an error")
+                    # 取最近一条带 phase 字段的记录判断当前阶段
+                    phase = detect_log_phase(lines)
+                    if phase == 'waiting':
+                        print("\n⏳ [Status: Currently in waiting phase - monitoring GPU usage]")
+                        print("💡 Use 'occupy off' to cancel waiting and exit")
+                    elif phase == 'occupation':
+                        print("\n🔥 [Status: Currently occupying GPU memory and compute]")
+                        print("💡 Use 'occupy off' to stop occupation and exit")
+                else:
+                    print("\n📝 Log file exists but is empty")
+                    print("💡 Process may be initializing or encountered an error")
             except Exception as e:
                 print(f"❌ Error reading log file: {e}")
         else:
@@ -362,33 +580,32 @@ def status_occupy():
         print("⭕ Occupy is not running")
         cleanup_pid_file()  # 清理可能存在的旧 PID 文件
 
+# on 命令中可由配置文件提供默认值的参数
+_CONFIG_ARG_KEYS = ('gpus', 'memory', 'sleep_min', 'compute_min', 'no_compute',
+                    'wait_minutes', 'mem_threshold', 'refresh_minutes')
+
 def main():
-    # 加载配置默认值
-    config_defaults = load_config_defaults()
-    
     parser = argparse.ArgumentParser(description="GPU Memory and Utilization Occupancy Control Script")
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
 
-    # on 命令
+    # on 命令（默认值用 None 占位，仅在实际启动时才读取配置文件）
     on_parser = subparsers.add_parser('on', help='Start GPU occupation')
-    on_parser.add_argument("--gpus", nargs="+", type=int, default=config_defaults['gpus'],
-                          help=f"GPU indexes to use (default: {config_defaults['gpus']})")
-    on_parser.add_argument("--memory", type=float, default=config_defaults['memory'],
-                          help=f"Memory size to occupy in GB (default: {config_defaults['memory']})")
-    on_parser.add_argument("--sleep_min", type=float, default=config_defaults['sleep_min'],
-                          help=f"Sleep time between compute cycles in minutes (default: {config_defaults['sleep_min']})")
-    on_parser.add_argument("--compute_min", type=float, default=config_defaults['compute_min'],
-                          help=f"Duration of each compute cycle in minutes (default: {config_defaults['compute_min']})")
-    on_parser.add_argument("--no_compute", action='store_true', default=config_defaults['no_compute'],
-                          help=f"Disable compute workload (default: {config_defaults['no_compute']})")
-    on_parser.add_argument("--wait_minutes", type=float, default=config_defaults['wait_minutes'],
-                          help=f"Wait this many minutes after all GPUs have low memory before occupation starts (default: {config_defaults['wait_minutes']})")
-    on_parser.add_argument("--mem_threshold", type=float, default=config_defaults['mem_threshold'],
-                          help=f"Memory threshold in GB - occupy when all GPU used memory < threshold (default: {config_defaults['mem_threshold']})")
-    on_parser.add_argument("--refresh_minutes", type=float, default=config_defaults['refresh_minutes'],
-                          help=f"Check interval in minutes for GPU memory status (default: {config_defaults['refresh_minutes']})")
-    # 设置计算默认值
-    on_parser.set_defaults(compute=not config_defaults['no_compute'])
+    on_parser.add_argument("--gpus", nargs="+", type=int, default=None,
+                          help="GPU indexes to use (default: from config.yaml)")
+    on_parser.add_argument("--memory", type=float, default=None,
+                          help="Memory size to occupy in GB (default: from config.yaml)")
+    on_parser.add_argument("--sleep_min", type=float, default=None,
+                          help="Sleep time between compute cycles in minutes (default: from config.yaml)")
+    on_parser.add_argument("--compute_min", type=float, default=None,
+                          help="Duration of each compute cycle in minutes (default: from config.yaml)")
+    on_parser.add_argument("--no_compute", action='store_true', default=None,
+                          help="Disable compute workload (default: from config.yaml)")
+    on_parser.add_argument("--wait_minutes", type=float, default=None,
+                          help="Wait this many minutes after all GPUs have low memory before occupation starts (default: from config.yaml)")
+    on_parser.add_argument("--mem_threshold", type=float, default=None,
+                          help="Memory threshold in GB - occupy when all GPU used memory < threshold (default: from config.yaml)")
+    on_parser.add_argument("--refresh_minutes", type=float, default=None,
+                          help="Check interval in minutes for GPU memory status (default: from config.yaml)")
 
     # off 命令
     subparsers.add_parser('off', help='Stop GPU occupation')
@@ -399,6 +616,11 @@ def main():
     args = parser.parse_args()
 
     if args.command == 'on':
+        # 只有 on 需要默认配置，off/status 不再触发 YAML 读取
+        config_defaults = load_config_defaults()
+        for key in _CONFIG_ARG_KEYS:
+            if getattr(args, key) is None:
+                setattr(args, key, config_defaults[key])
         start_occupy(args)
     elif args.command == 'off':
         stop_occupy()